@@ -17,15 +17,15 @@ application logic, routing inputs to appropriate handlers.
 
 # Python Standard Library
 from datetime import datetime
-from typing import Any, Dict, List, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union
 import json
 
 # Third-Party Libraries
-import ipywidgets as widgets
+if TYPE_CHECKING:
+    import ipywidgets as widgets
 
 # Local
 from .config import ConfigManager
-from .forms import create_entry_form
 from .handlers import handle_start
 from .handlers import handle_runs
 from .utils import PackageManager
@@ -35,6 +35,15 @@ from .utils import validate_project
 
 
 
+# Setting names and types of the start and update form arguments, in order
+_SETTINGS_FIELDS = (
+    ('PROJ_TITLE', str),
+    ('NB', int),
+    ('NB_NAME', str),
+    ('SEQ_NOTATION', int),
+    ('SEQ_SPARSE', int),
+    ('SITE_OPTIONS', list),
+)
 
 
 
@@ -84,7 +93,7 @@ def update_project(package):
     return 1
 
 
-def add_project() -> widgets.VBox:
+def add_project() -> 'widgets.VBox':
     """
     Create entry form for adding new items to the project.
     
@@ -96,6 +105,9 @@ def add_project() -> widgets.VBox:
     widgets.VBox
         IPyWidgets form widget for data entry
     """
+    # Forms pull in ipywidgets, so load them only when a form is requested
+    from .forms import create_entry_form # pylint: disable=import-outside-toplevel
+
     config = ConfigManager()
 
     form_entry = create_entry_form(config)
@@ -126,9 +138,7 @@ def run_project(package: PackageManager, data: List[Any]) -> int:
 
     today = datetime.now()
 
-    handle_runs(config, package, data[0], today)
-
-    return 1
+    return handle_runs(config, package, data[0], today)
 
 
 def eevveerryyddaayy(*args: Any, **kwargs: Any) -> Union[int, Any]:
@@ -167,13 +177,13 @@ def eevveerryyddaayy(*args: Any, **kwargs: Any) -> Union[int, Any]:
 
     if (kwargs['source'] == 0) or (kwargs['source'] == 1):
 
+        if len(args) != len(_SETTINGS_FIELDS):
+            print(f'Expected {len(_SETTINGS_FIELDS)} project settings, got {len(args)}')
+            return 0
+
         package = {
-            'PROJ_TITLE': (str, args[0]),
-            'NB': (int, args[1]),
-            'NB_NAME': (str, args[2]),
-            'SEQ_NOTATION': (int, args[3]),
-            'SEQ_SPARSE': (int, args[4]),
-            'SITE_OPTIONS': (list, args[5])
+            key: (expected_type, value)
+            for (key, expected_type), value in zip(_SETTINGS_FIELDS, args)
         }
 
         if kwargs['source'] == 0:
@@ -214,9 +224,9 @@ def eevveerryyddaayy(*args: Any, **kwargs: Any) -> Union[int, Any]:
     elif kwargs['source'] == 3:
         # ENTRY FORM - every_entry.ipynb - button clicked
         package = PackageManager()
-        run_project(package, args)
+        status = run_project(package, args)
         package.reset()
-        return 1
+        return status
 
     else:
         print('Invalid source')
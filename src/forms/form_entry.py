@@ -8,13 +8,14 @@ Jupyter notebook environment.
 
 # Python Standard Library
 from ast import literal_eval
-import json  # pylint: disable=unused-import
+from functools import lru_cache
 from typing import Dict
 
 # Third-Party Libraries
 import ipywidgets as widgets
 
 # Local
+from src import eevveerryyddaayy
 from src.config import ConfigManager
 
 
@@ -27,6 +28,60 @@ from src.config import ConfigManager
 
 
 
+# Layout settings shared by the form sections
+_LAYOUTS = {
+    'container': {
+        'display': 'flex',
+        'flex_flow': 'column',
+        'align_items': 'center',
+        'width': '100%'
+    },
+    'head_label': {
+        'width': '50%',
+        'margin': '30px 0'
+    },
+    'main_label': {
+        'width': '50%',
+        'margin': '0'
+    },
+}
+
+# Label markup and widget keys of the main section, in display order
+_SECTIONS = tuple((f'<b>{heading}</b>', key) for heading, key in (
+    ('URL', 'url'),
+    ('Title', 'title'),
+    ('Site', 'site'),
+    ('Difficulty', 'difficulty'),
+    ('Problem', 'problem'),
+    ('Your Solution', 'submitted_solution'),
+    ('Site Solution', 'site_solution'),
+    ('Notes', 'notes'),
+))
+
+# Dropdown options, with an empty first choice so nothing is preselected
+_SITE_OPTIONS_DEFAULT = ('', 'Codewars', 'DataLemur', 'LeetCode')
+_DIFFICULTY_OPTIONS = ('', 'Easy', 'Medium', 'Hard')
+
+
+@lru_cache(maxsize=None)
+def _create_entry_form_layout(name: str) -> widgets.Layout:
+    """
+    Returns the shared layout instance for the given form element.
+
+    Parameters
+    ----------
+    name : str
+        Key of the layout settings in _LAYOUTS
+
+    Returns
+    -------
+    widgets.Layout
+        Layout instance, created on first use and reused by every widget
+        and form built afterwards
+    """
+    return widgets.Layout(**_LAYOUTS[name])
+
+
 def _create_entry_form_widgets(config: ConfigManager) -> Dict[str, widgets.Widget]:
     """
     Creates and returns the layout settings and widget definitions for the form.
@@ -52,13 +107,13 @@ def _create_entry_form_widgets(config: ConfigManager) -> Dict[str, widgets.Widge
     solution_layout = {**base_layout, 'height': '200px'}
 
     # Widget Definitions
-    url_widget = widgets.Textarea(
+    url_widget = widgets.Text(
         value='',
         placeholder='Enter url',
         layout=text_layout
     )
 
-    title_widget = widgets.Textarea(
+    title_widget = widgets.Text(
         value='',
         placeholder='Enter problem title',
         layout=text_layout
@@ -67,37 +122,35 @@ def _create_entry_form_widgets(config: ConfigManager) -> Dict[str, widgets.Widge
     site_options = config.get('SITE_OPTIONS')
 
     if site_options:
-        # Convert list to string representation for literal_eval
-        if isinstance(site_options, list):
-            site_options_str = str(site_options) # pylint: disable=invalid-name
-        else:
-            site_options_str = site_options
+        # Only settings stored as text need parsing; lists are used as they are
+        if isinstance(site_options, str):
+            site_options = literal_eval(site_options)
 
-        options_list = literal_eval(site_options_str)
+        options_list = tuple(site_options)
 
         # If only one option, make it both the options and default value
         if len(options_list) == 1:
             site_widget = widgets.Dropdown(
-                options=[options_list[0]],
+                options=options_list,
                 value=options_list[0],
                 layout=text_layout
             )
         else:
             site_widget = widgets.Dropdown(
-                options=[''] + options_list,
+                options=('',) + options_list,
                 value='',
                 layout=text_layout
             )
     else:
         # Default options if environment variable is not set
         site_widget = widgets.Dropdown(
-            options=['', 'Codewars', 'DataLemur', 'LeetCode'],
+            options=_SITE_OPTIONS_DEFAULT,
             value='',
             layout=text_layout
         )
 
     difficulty_widget = widgets.Dropdown(
-        options=['', 'Easy', 'Medium', 'Hard'],
+        options=_DIFFICULTY_OPTIONS,
         value='',
         layout=text_layout
     )
@@ -133,7 +186,7 @@ def _create_entry_form_widgets(config: ConfigManager) -> Dict[str, widgets.Widge
     page_title_widget = widgets.Text(
         value='',
         placeholder='Enter page title',
-        layout=textarea_layout
+        layout=text_layout
     )
 
     widgets_package = {
@@ -153,6 +206,7 @@ def _create_entry_form_widgets(config: ConfigManager) -> Dict[str, widgets.Widge
     return widgets_package
 
 
+@lru_cache(maxsize=1)
 def _create_entry_form_head() -> widgets.VBox:
     """
     Creates the header section of the form.
@@ -169,19 +223,12 @@ def _create_entry_form_head() -> widgets.VBox:
     Notes
     -----
     Builds a header component with title and optional description
-    for the form interface.
+    for the form interface. The header has no inputs and is never
+    modified, so it is built once and shared by every form.
     """
-    label_layout = widgets.Layout(
-        width='50%',
-        margin='30px 0',
-    )
+    label_layout = _create_entry_form_layout('head_label')
 
-    container_layout = widgets.Layout(
-        display='flex',
-        flex_flow='column',
-        align_items='center',
-        width='100%'
-    )
+    container_layout = _create_entry_form_layout('container')
 
     description = 'Lorem ipsum dolor sit amet, consectetur adipiscing elit.'
 
@@ -214,36 +261,21 @@ def _create_entry_form_main(config: ConfigManager, pidgets: Dict[str, widgets.Wi
     Constructs the main form body with all input fields organized in
     a vertical layout with appropriate labels.
     """
-    label_layout = widgets.Layout(
-        width='50%',
-        margin='0'
-    )
+    label_layout = _create_entry_form_layout('main_label')
 
-    container_layout = widgets.Layout(
-        display='flex',
-        flex_flow='column',
-        align_items='center',
-        width='100%'
-    )
+    container_layout = _create_entry_form_layout('container')
 
-    sections = [
-        ('URL', pidgets['url']),
-        ('Title', pidgets['title']),
-        ('Site', pidgets['site']),
-        ('Difficulty', pidgets['difficulty']),
-        ('Problem', pidgets['problem']),
-        ('Your Solution', pidgets['submitted_solution']),
-        ('Site Solution', pidgets['site_solution']),
-        ('Notes', pidgets['notes'])
-    ]
+    sections = _SECTIONS
 
+    # The optional sixth column is named by the user, so it is added per form
     if config.get('NB') == 1:
-        sections.append((config.get('NB_NAME'), pidgets['nb']))
+        sections += ((f"<b>{config.get('NB_NAME')}</b>", 'nb'),)
 
+    # Labels and fields sit directly in one column, without a box per row
     section_list = []
-    for heading, widget in sections:
-        label = widgets.HTML(value=f'<b>{heading}</b>', layout=label_layout)
-        section_list.append(widgets.VBox([label, widget], layout=container_layout))
+    for label_html, key in sections:
+        section_list.append(widgets.HTML(value=label_html, layout=label_layout))
+        section_list.append(pidgets[key])
 
     section_main = widgets.VBox(section_list, layout=container_layout)
 
@@ -273,12 +305,7 @@ def _create_entry_form_button(config: ConfigManager, pidgets: Dict[str, widgets.
     - validate_form_data(): Validates all form inputs
     - execute_runs(): Processes validated form data and triggers actions
     """
-    container_layout = widgets.Layout(
-        display='flex',
-        flex_flow='column',
-        align_items='center',
-        width='100%'
-    )
+    container_layout = _create_entry_form_layout('container')
 
     def validate_form_data():
 
@@ -336,8 +363,6 @@ def _create_entry_form_button(config: ConfigManager, pidgets: Dict[str, widgets.
 
         # print(form_inputs_validated)
 
-        from src import eevveerryyddaayy # pylint: disable=import-outside-toplevel
-
         eevveerryyddaayy(form_inputs_validated, source=3)
 
     create_button = widgets.Button(description='Process Entry', tooltip='Processing...')
@@ -369,12 +394,7 @@ def create_entry_form(config: ConfigManager) -> widgets.VBox:
     and submission button into a single form interface. This is the main
     entry point for creating the form.
     """
-    container_layout = widgets.Layout(
-        display='flex',
-        flex_flow='column',
-        align_items='center',
-        width='100%'
-    )
+    container_layout = _create_entry_form_layout('container')
 
     widgets_package = _create_entry_form_widgets(config)
 
@@ -26,27 +26,41 @@ Functions:
 """
 
 # Python Standard Library
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import json
-import os
-import re
-from typing import Any, Dict, Optional, Tuple, Union
+import string
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 # Local
 from src.config import ConfigManager
 from src.utils import HYPHEN
-from src.utils import INDEX_START
-from src.utils import INDEX_END
 from src.utils import PackageManager
 from src.utils import clean_strings
 from src.utils import get_files_created
+from src.utils import get_index_bounds
+from src.utils import get_solutions_last
 from src.utils import get_target_line_dict
 from src.utils import get_target_line_updated
+from src.utils import write_file_atomic
 
 
 
 
 
+class _FilenameTable(dict):
+    """
+    Translation table for str.translate that deletes any character not
+    explicitly kept. Unseen characters are cached as deletions on first use.
+    """
+    def __missing__(self, key: int) -> None:
+        self[key] = None
+
+
+# Keeps lowercase ASCII letters, digits and whitespace, with spaces and
+# hyphens mapped to underscores
+_FILENAME_CHARS = string.ascii_lowercase + string.digits + string.whitespace
+_FILENAME_TABLE = _FilenameTable({i: (chr(i) if chr(i) in _FILENAME_CHARS else None) for i in range(128)})
+_FILENAME_TABLE.update({ord(' '): '_', ord('-'): '_'})
 
 
 
@@ -92,12 +106,12 @@ def _handle_runs_prep_seq(
     seq_notation_loc = config.get('SEQ_NOTATION')
     seq_next_full_str = ''
 
-    with os.scandir(config.get('SOLUTIONS_DIR')) as entries:
-        files = sorted(entry.name for entry in entries)
+    # Dates are stored as ISO strings with U+2011 in place of the hyphens
+    today_str = today.date().isoformat().replace('-', HYPHEN)
 
-    if files:
+    file_last = get_solutions_last(config.get('SOLUTIONS_DIR'))
 
-        file_last = files[-1]
+    if file_last is not None:
 
         # Handle sequence partials (main and suffix)
         if seq_notation_loc == 0:
@@ -105,17 +119,21 @@ def _handle_runs_prep_seq(
             seq_last_main = int(file_last[:3])
             seq_last_suffix = int(file_last[4:6])
 
-            seq_next_main = datetime.strptime(seq_start_loc, f'%Y{HYPHEN}%m{HYPHEN}%d').date()
+            seq_next_main = date.fromisoformat(seq_start_loc.replace(HYPHEN, '-'))
             seq_next_main = (today.date() - seq_next_main).days + 1
             seq_next_main_str = f'{seq_next_main:03d}'
 
         elif seq_notation_loc == 1:
 
-            seq_last_main = datetime.strptime(file_last[:10], f'%Y{HYPHEN}%m{HYPHEN}%d').date()
-            seq_last_suffix = int(file_last[11:13])
+            seq_next_main = today.date()
+            seq_next_main_str = today_str
 
-            seq_next_main = datetime.now().date()
-            seq_next_main_str = seq_next_main.strftime(f'%Y{HYPHEN}%m{HYPHEN}%d')
+            # Same-format date strings compare equal, so repeat entries skip parsing
+            if file_last[:10] == today_str:
+                seq_last_main = seq_next_main
+            else:
+                seq_last_main = date.fromisoformat(file_last[:10].replace(HYPHEN, '-'))
+            seq_last_suffix = int(file_last[11:13])
 
         else:
             raise ValueError('Invalid configuration: TODO')
@@ -152,7 +170,7 @@ def _handle_runs_prep_seq(
             seq_last_main = None
             seq_next_main = None
 
-            seq_next_main_str = today.strftime(f'%Y{HYPHEN}%m{HYPHEN}%d')
+            seq_next_main_str = today_str
             seq_next_suffix_str = '01'
             seq_next_full_str = f'{seq_next_main_str}_{seq_next_suffix_str}'
 
@@ -190,9 +208,7 @@ def _handle_runs_prep_file(
     - Replacing spaces and hyphens with underscores
     """
     filename = title.lower()
-    filename = re.sub(r'[^a-z0-9\s-]', '', filename)
-    filename = filename.replace(' ', '_')
-    filename = filename.replace('-', '_')
+    filename = filename.translate(_FILENAME_TABLE)
     filename = f'{seq_full}_{filename.strip()}.md'
 
 
@@ -201,6 +217,7 @@ def _handle_runs_prep_file(
 
 def _handle_runs_prep_index(
         config: ConfigManager,
+        lines: List[str],
         seq_last: Optional[Union[int, datetime.date]], 
         seq_next: Union[int, datetime.date]
     ) -> int:
@@ -211,6 +228,8 @@ def _handle_runs_prep_index(
     ----------
     config : ConfigManager
         Custom container for validating, storing and retrieving application settings
+    lines : List[str]
+        Lines of README.md, updated in place
     seq_last : Optional[Union[int, datetime.date]]
         Previous sequence number or date
     seq_next : Union[int, datetime.date]
@@ -219,7 +238,7 @@ def _handle_runs_prep_index(
     Returns
     -------
     int
-        1 if successful
+        Number of gap rows inserted
         
     Raises
     ------
@@ -232,6 +251,8 @@ def _handle_runs_prep_index(
     For numeric sequences, creates entries for each missing number.
     Gap entries are added to maintain continuity in the index table.
     """
+    count = 0
+
     if seq_last is not None or seq_next is not None:
 
         if config.get('NB') == 1:
@@ -240,52 +261,39 @@ def _handle_runs_prep_index(
             gap_line = '|    |    |    |    |\n'
 
 
-        with open('README.md', 'r+', encoding='utf-8') as file:
-            lines = file.readlines()
+        _, target_line = get_index_bounds(lines)
 
-            target_line = len(lines) - 1
-            while target_line >= 0:
-                if INDEX_END in lines[target_line]:
-                    break
-                target_line -= 1
+        seq_notation = config.get('SEQ_NOTATION')
 
-            seq_notation = config.get('SEQ_NOTATION')
+        # Case: 001
+        if seq_notation == 0:
+            if seq_next - seq_last > 1:
 
-            # Case: 001
-            if seq_notation == 0:
-                if seq_next - seq_last > 1:
+                for i in range(seq_last + 1, seq_next):
+                    seq_gap_str = f'{i:03d}'
+                    lines.insert(target_line + count, f'| {seq_gap_str}   {gap_line}')
+                    count += 1
 
-                    count = 0
-                    for i in range(seq_last + 1, seq_next):
-                        seq_gap_str = f'{i:03d}'
-                        lines.insert(target_line + count, f'| {seq_gap_str}   {gap_line}')
-                        count += 1
+        # Case: 2025-01-01
+        elif seq_notation == 1:
+            if (seq_next - seq_last).days > 1:
 
-            # Case: 2025-01-01
-            elif seq_notation == 1:
-                if (seq_next - seq_last).days > 1:
+                seq_bound = seq_next
 
-                    seq_bound = seq_next
+                seq_gap = seq_last + timedelta(days=1)
 
-                    count = 0
-                    seq_gap = seq_last + timedelta(days=1)
+                while seq_gap < seq_bound:
+                    seq_gap_str = seq_gap.isoformat().replace('-', HYPHEN)
+                    lines.insert(target_line + count, f'| {seq_gap_str}   {gap_line}')
+                    count += 1
+                    seq_gap += timedelta(days=1)
 
-                    while seq_gap < seq_bound:
-                        seq_gap_str = seq_gap.strftime(f'%Y{HYPHEN}%m{HYPHEN}%d')
-                        lines.insert(target_line + count, f'| {seq_gap_str}   {gap_line}')
-                        count += 1
-                        seq_gap += timedelta(days=1)
-
-            # Case: Invalid
-            else:
-                raise ValueError('Invalid configuration: TODO')
+        # Case: Invalid
+        else:
+            raise ValueError('Invalid configuration: TODO')
 
-            file.seek(0)
-            file.writelines(lines)
-            file.truncate()
 
-
-    return 1
+    return count
 
 
 def _handle_runs_prep_package(
@@ -321,29 +329,40 @@ def _handle_runs_prep_package(
     - package dictionary: Stores data submitted through form
     - package_widths dictionary: Stores column width calculations for display formatting
     """
+    # Format Index values once and reuse them for widths
+    title_index = f'[{new_package["title"]}]({new_package["url"]})'
+    solution_index = f'[Solution](solutions/{filename})'
+
     # Update package
-    package.update_value('package', 'day', seq)
-    package.update_value('package', 'url', new_package["url"])
-    package.update_value('package', 'title', new_package["title"])
-    package.update_value('package', 'title_index', f'[{new_package["title"]}]({new_package["url"]})')
-    package.update_value('package', 'solution', f'[Solution](solutions/{filename})')
-    package.update_value('package', 'site', new_package["site"])
-    package.update_value('package', 'difficulty', new_package["difficulty"])
-    package.update_value('package', 'problem', new_package["problem"])
-    package.update_value('package', 'submitted_solution', new_package["submitted_solution"])
-    package.update_value('package', 'site_solution', new_package["site_solution"])
-    package.update_value('package', 'notes', new_package["notes"])
-    package.update_value('package', 'nb', new_package["nb"])
-    package.update_value('package', 'seq_full', seq_full)
-    package.update_value('package', 'filename', filename)
-
-    # Update entry_data_widths
-    package.update_value('package_widths', 'day', len(seq) + 2)
-    package.update_value('package_widths', 'title', len(f'[{new_package["title"]}]({new_package["url"]})') + 2)
-    package.update_value('package_widths', 'solution', len(f'[Solution](solutions/{filename})') + 2)
-    package.update_value('package_widths', 'site', len(new_package["site"]) + 2)
-    package.update_value('package_widths', 'difficulty', len(new_package["difficulty"]) + 2)
-    package.update_value('package_widths', 'nb', len(new_package["nb"]) + 2)
+    package.update_values('package', {
+        'day': seq,
+        'url': new_package['url'],
+        'title': new_package['title'],
+        'title_index': title_index,
+        'solution': solution_index,
+        'site': new_package['site'],
+        'difficulty': new_package['difficulty'],
+        'problem': new_package['problem'],
+        'submitted_solution': new_package['submitted_solution'],
+        'site_solution': new_package['site_solution'],
+        'notes': new_package['notes'],
+        'nb': new_package['nb'],
+        'seq_full': seq_full,
+        'filename': filename,
+    })
+
+    # Update package_widths from the values shown in each Index column
+    index_values = {
+        'day': seq,
+        'title': title_index,
+        'solution': solution_index,
+        'site': new_package['site'],
+        'difficulty': new_package['difficulty'],
+        'nb': new_package['nb'],
+    }
+    package.set_dictionary('package_widths', {
+        key: len(value) + 2 for key, value in index_values.items()
+    })
 
 
     return 1
@@ -352,6 +371,7 @@ def _handle_runs_prep_package(
 def _handle_runs_prep(
         config: ConfigManager,
         package: PackageManager,
+        lines: List[str],
         data: Dict[str, str], today: datetime
     ) -> int:
     """
@@ -363,6 +383,8 @@ def _handle_runs_prep(
         Custom container for validating, storing and retrieving application settings
     package : PackageManager
         Custom container for storing and retrieving form data and derived values
+    lines : List[str]
+        Lines of README.md, updated in place
     data : Dict[str, str]
         Dictionary containing form input data
     today : datetime
@@ -371,7 +393,7 @@ def _handle_runs_prep(
     Returns
     -------
     int
-        1 if successful
+        Number of gap rows inserted into the Index
 
     Raises
     ------
@@ -394,19 +416,22 @@ def _handle_runs_prep(
     filename = _handle_runs_prep_file(data['title'], seq_next_full_str)
 
     # Prepare Index
+    gap_rows = 0
     if config.get('SEQ_SPARSE') == 1:
-        _handle_runs_prep_index(config, seq_last_main, seq_next_main)
+        gap_rows = _handle_runs_prep_index(config, lines, seq_last_main, seq_next_main)
 
     # Update PackageHandler dicts
     _handle_runs_prep_package(package, seq_next_main_str, seq_next_full_str, data, filename)
 
-    return 1
+    return gap_rows
 
 
 def _handle_runs_implement(
         config: ConfigManager,
-        package: PackageManager
-    ) -> int:
+        package: PackageManager,
+        lines: List[str],
+        gap_rows: int
+    ) -> Dict[str, int]:
     """
     Process new entries by creating files and updating the Index table.
 
@@ -416,11 +441,15 @@ def _handle_runs_implement(
         Custom container for validating, storing and retrieving application settings
     package : PackageManager
         Custom container for storing and retrieving form data and derived values
+    lines : List[str]
+        Lines of README.md, updated in place
+    gap_rows : int
+        Number of unpadded gap rows just inserted before the end marker
 
     Returns
     -------
-    int
-        1 if successful
+    Dict[str, int]
+        The package_widths dictionary as updated for the Index table
 
     Notes
     -----
@@ -433,78 +462,82 @@ def _handle_runs_implement(
     Prerequisites:
     - Properly initialized configuration
     - Properly updated package dictionaries
-    - Valid README.md with index block markers
+    - README.md lines with index block markers
     """
+    # Bind live package dictionaries once for all stages below
+    package_data = package.get_dictionary('package')
+    package_widths = package.get_dictionary('package_widths')
+    nb_loc = config.get('NB')
+
     # CREATE NEW FILE
-    get_files_created(config, package.get_dictionary('package'))
+    get_files_created(config, package_data)
 
 
     # UPDATE config_cols_widths
-    change_old_lines = 0
+    # Old lines only need re-formatting when the new entry widens a column
+    changed_keys = set()
     for key, config_value in config.get('COLS_WIDTH').items():
-        package_value = package.get_dictionary('package_widths')[key]
+        package_value = package_widths[key]
         if package_value < config_value:
-            package.update_value('package_widths', key, config_value)
-            change_old_lines = 1
+            package_widths[key] = config_value
+        elif package_value > config_value:
+            changed_keys.add(key)
+
+    # The sixth column is not shown when NB is 0, so widening it alone changes no line
+    if nb_loc == 0:
+        changed_keys.discard('nb')
 
-    # print(change_old_lines)
+    change_old_lines = bool(changed_keys)
 
     # CREATE NEW LINE
-    if package.get_value('package', 'nb') == 'TBD':
-        package.update_value('package', 'nb_index', '')
+    if package_data['nb'] == 'TBD':
+        package_data['nb_index'] = ''
+
+    new_entry_data = {key: package_data[key] for key in package_widths}
 
     new_entry = get_target_line_updated(False,
-                                        config,
-                                        package,
-                                        data=None)
+                                        nb_loc,
+                                        package_widths,
+                                        data=new_entry_data)
 
     # print(new_entry)
 
     # UPDATE INDEX
-    with open('README.md', 'r+', encoding='utf-8') as file:
-        lines = file.readlines()
-
-        start_line = None
-        end_line = None
+    # GET START AND END LINES OF INDEX
+    start_line, end_line = get_index_bounds(lines)
 
-        # GET START AND END LINES OF INDEX
-        for i, line in enumerate(lines):
-            if INDEX_START in line:
-                start_line = i  # Line numbers start from 1
-            if INDEX_END in line:
-                end_line = i
 
+    # UPDATE TARGET LINES (if needed)
+    # The header and separator always sit at start_line + 1 and start_line + 2,
+    # so they are re-padded along with entries even on the first run.
+    # A widened column changes every line; otherwise only new gap rows need padding
+    if change_old_lines:
+        first_line = start_line + 1
+    else:
+        first_line = end_line - gap_rows
 
-        # UPDATE TARGET LINES (if needed)
-        if change_old_lines == 1:
-
-            # Process each line between start_line and end_line
-            for i in range(start_line + 1, end_line):
+    # Process each line between first_line and end_line
+    for i in range(first_line, end_line):
 
-                # Convert target line (str) to data (dict)
-                target_line_data = get_target_line_dict(config.get('NB'),
-                                                        lines[i])
+        # Convert target line (str) to data (dict)
+        target_line_data = get_target_line_dict(nb_loc, lines[i])
 
-                # Update target line
-                is_second_line = bool(i == start_line + 2)
+        # Update target line
+        is_second_line = bool(i == start_line + 2)
 
-                line_updated = get_target_line_updated(is_second_line,
-                                                       config,
-                                                       package,
-                                                       data=target_line_data)
+        line_updated = get_target_line_updated(is_second_line,
+                                               nb_loc,
+                                               package_widths,
+                                               data=target_line_data)
 
-                # Replace the original line with the updated one
-                lines[i] = f'{line_updated}\n'
+        # Replace the original line with the updated one
+        lines[i] = f'{line_updated}\n'
 
-        # INSERT NEW LINE TO LINES
-        lines.insert(end_line, f'{new_entry}\n')
+    # INSERT NEW LINE TO LINES
+    lines.insert(end_line, f'{new_entry}\n')
 
-        file.seek(0)
-        file.writelines(lines)
-        file.truncate()
 
-
-    return 1
+    return package_widths
 
 
 def _handle_runs_close(
@@ -525,30 +558,31 @@ def _handle_runs_close(
     -------
     int
         1 on successful completion
-        
+
+    Raises
+    ------
+    ValueError
+        If the COLS_WIDTH dictionary is not found in config_index.py
+
     Notes
     -----
     Updates the config_index.py file by replacing the COLS_WIDTH dictionary
-    with updated values serialized as JSON.
+    with updated values serialized as JSON. The dictionary is expected to
+    be the last statement in the file.
     """
-    with open(f"{config.get('CONFIG_DIR')}/config_index.py", 'r+', encoding='utf-8') as file:
-        lines = file.readlines()
-
-        line_target = None
-        for i, line in enumerate(lines):
-            if 'COLS_WIDTH = {' in line:
-                line_target = i
-                break
+    path = f"{config.get('CONFIG_DIR')}/config_index.py"
 
-        del lines[line_target:]
+    # Marker and JSON are ASCII, so splice bytes without decoding the file
+    with open(path, 'rb') as file:
+        text = file.read()
 
-        data = f'COLS_WIDTH = {json.dumps(column_widths, indent=4)}\n'
+    target = text.rfind(b'COLS_WIDTH = {')
+    if target < 0:
+        raise ValueError('Invalid configuration: COLS_WIDTH not found in config_index.py')
 
-        lines[line_target:line_target] = data.splitlines(True)
+    data = f'COLS_WIDTH = {json.dumps(column_widths, indent=4)}\n'.encode('ascii')
 
-        file.seek(0)
-        file.writelines(lines)
-        file.truncate()
+    write_file_atomic(path, text[:target] + data)
 
 
     return 1
@@ -582,9 +616,11 @@ def handle_runs(
     -----
     Flow:
     1. Validates and cleans input strings
-    2. Initiates run configuration process
-    3. Implements run settings by creating files and updating index table
-    4. Updates configuration column widths for future entries
+    2. Reads README.md once for all stages
+    3. Initiates run configuration process
+    4. Implements run settings by creating files and updating index table
+    5. Writes README.md back in a single pass
+    6. Updates configuration column widths for future entries
     """
     # REVIEW DATA FROM FORM
     # print(json.dumps(data, indent=4))
@@ -594,14 +630,21 @@ def handle_runs(
         data['nb'] = 'TBD'
     data = clean_strings(data)
 
+    # READ README (shared by all stages, written back once)
+    with open('README.md', 'r', encoding='utf-8') as file:
+        lines = file.readlines()
+
     # RUNS - START (FIRST OR REGULAR)
-    _handle_runs_prep(config, package, data, today)
+    gap_rows = _handle_runs_prep(config, package, lines, data, today)
 
     # RUNS - IMPLEMENT
-    _handle_runs_implement(config, package)
+    column_widths = _handle_runs_implement(config, package, lines, gap_rows)
+
+    # WRITE README
+    write_file_atomic('README.md', ''.join(lines))
 
     # RUNS - CLOSE
-    _handle_runs_close(config, package.get_dictionary('package_widths'))
+    _handle_runs_close(config, column_widths)
 
 
     return 1
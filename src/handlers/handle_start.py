@@ -12,24 +12,26 @@ Functions:
     Private (internal use only):
         _handle_start_date: Updates project start date in config
         _handle_start_configs: Updates configuration files with environment variables
+        _handle_start_configs_patch: Replaces setting assignments in a config file
         _handle_start_readme: Sets up notebook column in README and templates
         _handle_start_solutions: Handles solution file initialization 
         _handle_start_template: Updates project title in files
 """
 
 # Python Standard Library
-from datetime import datetime
-import json  # pylint: disable=unused-import
+from datetime import date
 import os
+import re
 import shutil
+from typing import Dict
 
 # Third-Party Libraries
 
 # Local
 from src.config import ConfigManager
 from src.utils import HYPHEN
-from src.utils import INDEX_START
-from src.utils import INDEX_END
+from src.utils import get_index_bounds
+from src.utils import write_file_atomic
 
 
 
@@ -72,8 +74,7 @@ def _handle_start_files(
     destination_path = os.path.join(destination_dir, destination_file)
 
     # Ensure destination directory exists
-    if not os.path.exists(destination_dir):
-        os.makedirs(destination_dir)
+    os.makedirs(destination_dir, exist_ok=True)
 
     # Step 1: Check if target file exists and move it
     if os.path.exists(target_path):
@@ -109,19 +110,19 @@ def _handle_start_date(
     int
         1 if update successful
     """
-    today = datetime.now().strftime(f'%Y{HYPHEN}%m{HYPHEN}%d')
+    today = date.today().isoformat().replace('-', HYPHEN)
 
-    with open(f"{config.get('CONFIG_DIR')}/config_proj.py", 'r+', encoding='utf-8') as file:
+    path = f"{config.get('CONFIG_DIR')}/config_proj.py"
+
+    with open(path, 'r', encoding='utf-8') as file:
         lines = file.readlines()
 
-        for i, line in enumerate(lines):
+    for i, line in enumerate(lines):
 
-            if line.startswith('PROJ_START='):
-                lines[i] = f'PROJ_START=\'{today}\'\n'
+        if line.startswith('PROJ_START='):
+            lines[i] = f'PROJ_START=\'{today}\'\n'
 
-        file.seek(0)
-        file.writelines(lines)
-        file.truncate()
+    write_file_atomic(path, ''.join(lines))
 
     return 1
 
@@ -148,14 +149,48 @@ def _handle_start_solutions(
     solutions_dir = config.get("SOLUTIONS_DIR")
 
     try:
-        if not os.path.exists(solutions_dir):
-            os.makedirs(solutions_dir)
+        os.makedirs(solutions_dir, exist_ok=True)
 
         return 1
     except OSError:
         return 0
 
 
+def _handle_start_configs_patch(
+        path: str,
+        patches: Dict[str, str]
+    ) -> int:
+    """
+    Replace the assignment lines of selected settings in a config file.
+
+    Parameters
+    ----------
+    path : str
+        Path to the config file to update
+    patches : Dict[str, str]
+        Dictionary mapping setting names to their replacement assignments
+
+    Returns
+    -------
+    int
+        1 if update successful
+
+    Notes
+    -----
+    Only top-level assignments (e.g. "NB=0") are matched. All settings are
+    replaced in a single regex pass over the file text.
+    """
+    pattern = re.compile(rf"^({'|'.join(map(re.escape, patches))})=.*$", re.MULTILINE)
+
+    with open(path, 'r', encoding='utf-8') as file:
+        text = file.read()
+
+    write_file_atomic(path, pattern.sub(lambda match: patches[match.group(1)], text))
+
+
+    return 1
+
+
 def _handle_start_configs(
         config: ConfigManager
     ) -> int:
@@ -179,50 +214,22 @@ def _handle_start_configs(
     - config_index.py: Index table settings in README.md
     - config_proj.py: Project start date and title
     """
-    with open(f"{config.get('CONFIG_DIR')}/config_form.py", 'r+', encoding='utf-8') as file:
-        lines = file.readlines()
-
-        for i, line in enumerate(lines):
-
-            if line.startswith('SITE_OPTIONS='):
-                lines[i] = f"SITE_OPTIONS={config.get('SITE_OPTIONS')}\n"
-
-        file.seek(0)
-        file.writelines(lines)
-        file.truncate()
-
-    with open(f"{config.get('CONFIG_DIR')}/config_index.py", 'r+', encoding='utf-8') as file:
-        lines = file.readlines()
+    config_dir = config.get('CONFIG_DIR')
 
-        for i, line in enumerate(lines):
+    _handle_start_configs_patch(f'{config_dir}/config_form.py', {
+        'SITE_OPTIONS': f"SITE_OPTIONS={config.get('SITE_OPTIONS')}",
+    })
 
-            if line.startswith('NB='):
-                lines[i] = f"NB={config.get('NB')}\n"
+    _handle_start_configs_patch(f'{config_dir}/config_index.py', {
+        'NB': f"NB={config.get('NB')}",
+        'NB_NAME': f"NB_NAME=\'{config.get('NB_NAME')}\'",
+        'SEQ_NOTATION': f"SEQ_NOTATION={config.get('SEQ_NOTATION')}",
+        'SEQ_SPARSE': f"SEQ_SPARSE={config.get('SEQ_SPARSE')}",
+    })
 
-            if line.startswith('NB_NAME='):
-                lines[i] = f"NB_NAME=\'{config.get('NB_NAME')}\'\n"
-
-            if line.startswith('SEQ_NOTATION='):
-                lines[i] = f"SEQ_NOTATION={config.get('SEQ_NOTATION')}\n"
-
-            if line.startswith('SEQ_SPARSE='):
-                lines[i] = f"SEQ_SPARSE={config.get('SEQ_SPARSE')}\n"
-
-        file.seek(0)
-        file.writelines(lines)
-        file.truncate()
-
-    with open(f"{config.get('CONFIG_DIR')}/config_proj.py", 'r+', encoding='utf-8') as file:
-        lines = file.readlines()
-
-        for i, line in enumerate(lines):
-
-            if line.startswith('PROJ_TITLE='):
-                lines[i] = f"PROJ_TITLE=\'{config.get('PROJ_TITLE')}\'\n"
-
-        file.seek(0)
-        file.writelines(lines)
-        file.truncate()
+    _handle_start_configs_patch(f'{config_dir}/config_proj.py', {
+        'PROJ_TITLE': f"PROJ_TITLE=\'{config.get('PROJ_TITLE')}\'",
+    })
 
 
     return 1
@@ -251,45 +258,35 @@ def _handle_start_readme(
     with the configured notebook column name
     """
     nb_name = config.get('NB_NAME')
+    nb_sep = '-' * (len(nb_name) + 2)
 
     index_header = {
         'labels': f'| Day   | Title   | Solution   | Site   | Difficulty   | {nb_name}   |',
-        'sep': f'| ----- | ------- | ---------- | ------ | ------------ | { "-" * (len(nb_name) + 2) } |'
+        'sep': f'| ----- | ------- | ---------- | ------ | ------------ | {nb_sep} |'
     }
 
-    start_line_readme = None
-    end_line_readme = None
     lines_readme = []
 
-    with open('README.md', 'r+', encoding='utf-8') as file:
+    with open('README.md', 'r', encoding='utf-8') as file:
         lines_readme = file.readlines()
 
-        # HANDLE README CHANGES - TITLE
-        if 'PROJ_TITLE' in package_changes.keys():
-            lines_readme[0] = f'# {config.get("PROJ_TITLE")}\n'
-
-        # HANDLE README CHANGES - NB
-        if 'NB' in package_changes.keys() and 'NB_NAME' in package_changes.keys():
-            for i in range(len(lines_readme)-1, -1, -1):
-
-                if INDEX_START in lines_readme[i]:
-                    start_line_readme = i
+    # HANDLE README CHANGES - TITLE
+    if 'PROJ_TITLE' in package_changes.keys():
+        lines_readme[0] = f'# {config.get("PROJ_TITLE")}\n'
 
-                if INDEX_END in lines_readme[i]:
-                    end_line_readme = i
+    # HANDLE README CHANGES - NB
+    if 'NB' in package_changes.keys() and 'NB_NAME' in package_changes.keys():
+        start_line_readme, end_line_readme = get_index_bounds(lines_readme)
 
-            lines_readme[start_line_readme + 1] = f'{index_header["labels"]}\n'
-            lines_readme[start_line_readme + 2] = f'{index_header["sep"]}\n'
+        # Replace the whole Index body with the new header rows
+        lines_readme[start_line_readme + 1:end_line_readme] = [
+            f'{index_header["labels"]}\n',
+            f'{index_header["sep"]}\n'
+        ]
 
-            for j in range(start_line_readme + 3, end_line_readme):
+        print(f'Extra column selected: {nb_name}')
 
-                lines_readme[j] = ''
-
-            print(f'Extra column selected: {nb_name}')
-
-        file.seek(0)
-        file.writelines(lines_readme)
-        file.truncate()
+    write_file_atomic('README.md', ''.join(lines_readme))
 
     return 1
 
@@ -314,21 +311,26 @@ def _handle_start_template(
     """
     lines_template = []
 
-    with open(f'{config.get('TEMPLATES_DIR')}/solution.txt', 'r+', encoding='utf-8') as file:
+    path = f"{config.get('TEMPLATES_DIR')}/solution.txt"
+
+    with open(path, 'r', encoding='utf-8') as file:
         lines_template = file.readlines()
 
-        # HANDLE TEMPLATE CHANGES - TITLE
-        if 'PROJ_TITLE' in package_changes.keys():
-            lines_template[0] = f"# {config.get('PROJ_TITLE')} \\#{{{{ seq_full }}}}\n"
+    # HANDLE TEMPLATE CHANGES - TITLE
+    if 'PROJ_TITLE' in package_changes.keys():
+        lines_template[0] = f"# {config.get('PROJ_TITLE')} \\#{{{{ seq_full }}}}\n"
+
+    # HANDLE TEMPLATE CHANGES - NB
+    if 'NB' in package_changes.keys() and 'NB_NAME' in package_changes.keys():
+
+        # Lines 29 and 32 open and close the commented-out NB section
+        if not (lines_template[29].startswith('<!-- ## ') and lines_template[32].startswith('-->')):
+            raise ValueError('Invalid template: NB section not found at lines 30-33 of solution.txt')
 
-        # HANDLE TEMPLATE CHANGES - NB
-        if 'NB' in package_changes.keys() and 'NB_NAME' in package_changes.keys():
-            lines_template[29] = f'## {config.get('NB_NAME')}\n'
-            lines_template[32] = '\n'
+        lines_template[29] = f"## {config.get('NB_NAME')}\n"
+        lines_template[32] = '\n'
 
-        file.seek(0)
-        file.writelines(lines_template)
-        file.truncate()
+    write_file_atomic(path, ''.join(lines_template))
 
 
     return 1
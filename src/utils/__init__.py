@@ -20,12 +20,20 @@ Functions:
         Normalizes and sanitizes string inputs
     get_files_created:
         Generates solution files from template
+    get_files_created_many:
+        Generates several solution files from template in one pass
+    get_index_bounds:
+        Locates the Index block markers in README.md
+    get_solutions_last:
+        Finds the latest solution filename in the solutions directory
     get_target_line_dict:
         Converts string to dictionary for downstream processing
     get_target_line_updated:
         Functions for locating and updating specific lines in Index table in README.md
     validate_project:
         Checks whether the project has been properly initialized
+    write_file_atomic:
+        Replaces file contents through a temporary file
 
 These utilities form the foundation for higher-level operations handled by the application's
 main modules and handlers.
@@ -37,8 +45,12 @@ from .utils_constants import INDEX_END
 from .utils_constants import FIRST_ROW
 from .utils_constants import SECOND_ROW
 from .utils_package import PackageManager
+from .utils_files import get_solutions_last
+from .utils_files import write_file_atomic
 from .utils_runs import clean_strings
 from .utils_runs import get_files_created
+from .utils_runs import get_files_created_many
+from .utils_runs import get_index_bounds
 from .utils_runs import get_target_line_dict
 from .utils_runs import get_target_line_updated
 from .utils_validation import validate_project
@@ -53,7 +65,11 @@ __all__ = [
     'PackageManager',
     'clean_strings',
     'get_files_created',
+    'get_files_created_many',
+    'get_index_bounds',
+    'get_solutions_last',
     'get_target_line_dict',
     'get_target_line_updated',
-    'validate_project'
+    'validate_project',
+    'write_file_atomic'
 ]
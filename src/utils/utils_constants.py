@@ -9,9 +9,11 @@ Constants
 HYPHEN : str
     Unicode non-breaking hyphen character for dates
 INDEX_START : str
-    Markdown comment marking the start of Index table section in README.md
+    Markdown comment marking the start of Index table section in README.md,
+    expected at the beginning of its line
 INDEX_END : str
-    Markdown comment marking the end of Index table section in README.md
+    Markdown comment marking the end of Index table section in README.md,
+    expected at the beginning of its line
 FIRST_ROW : str
     Header row of Index table section in README.md
 SECOND_ROW : str
@@ -0,0 +1,86 @@
+"""
+Utility Functions for Project Files
+"""
+
+# Python Standard Library
+import os
+from typing import Optional, Union
+
+
+
+
+
+
+
+
+
+
+def get_solutions_last(solutions_dir: str) -> Optional[str]:
+    """
+    Return the last filename in the solutions directory.
+
+    Parameters
+    ----------
+    solutions_dir : str
+        Path to the directory containing solution files
+
+    Returns
+    -------
+    Optional[str]
+        Greatest filename in sort order, or None if there are no solution files
+
+    Notes
+    -----
+    Only regular .md files count as solution files. Subdirectories, symlinks
+    and stray files such as .DS_Store are ignored, using the file type that
+    scandir already reports without an extra stat call.
+
+    Solution filenames start with their sequence identifier, so the
+    greatest name belongs to the latest entry. The directory is scanned
+    in a single pass without sorting.
+    """
+    with os.scandir(solutions_dir) as entries:
+        file_last = max(
+            (
+                entry.name for entry in entries
+                if entry.name.endswith('.md') and entry.is_file(follow_symlinks=False)
+            ),
+            default=None
+        )
+
+    return file_last
+
+
+def write_file_atomic(path: str, content: Union[str, bytes]) -> int:
+    """
+    Replace the contents of a file in a single step.
+
+    Parameters
+    ----------
+    path : str
+        Path to the file to replace
+    content : Union[str, bytes]
+        New file contents, written as UTF-8 text or raw bytes
+
+    Returns
+    -------
+    int
+        1 if write successful
+
+    Notes
+    -----
+    Content is written to a temporary file next to the target and moved into
+    place with os.replace, so a crash mid-write leaves the original intact.
+    """
+    temp_path = f'{path}.tmp'
+
+    if isinstance(content, bytes):
+        with open(temp_path, 'wb') as file:
+            file.write(content)
+    else:
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            file.write(content)
+
+    os.replace(temp_path, path)
+
+    return 1
@@ -2,6 +2,7 @@
 A data manager class for user data inputs from Jupyter IPywidgets forms.
 """
 
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional
 
 
@@ -60,72 +61,54 @@ class PackageManager:
         update_value(dict_name: str, key: str, value: Any) -> None
             Update value in specified dictionary
 
+        update_values(dict_name: str, values: Dict[str, Any]) -> None
+            Update several values in specified dictionary
+
         get_dictionary(dict_name: str) -> dict
             Retrieve entire dictionary by name
 
+        set_dictionary(dict_name: str, values: Dict[str, Any]) -> None
+            Replace entire dictionary by name
+
         reset(dict_names: Optional[List[str]] = None) -> None
             Reset dictionaries to initial state
     """
+    __slots__ = ('_data',)
+
+    # Initial keys and values of each dictionary, shared read-only by all instances
+    _DEFAULTS = MappingProxyType({
+        'package': (
+            ('day', ''),
+            ('url', ''),
+            ('title', ''),
+            ('title_index', ''),
+            ('site', ''),
+            ('difficulty', ''),
+            ('problem', ''),
+            ('submitted_solution', ''),
+            ('site_solution', ''),
+            ('solution', ''),
+            ('notes', ''),
+            ('nb', ''),
+            ('nb_index', ''),
+            ('seq_full', ''),
+            ('filename', ''),
+            ('lastline', '\n'),
+        ),
+
+        'package_widths': (
+            ('day', 0),
+            ('title', 0),
+            ('solution', 0),
+            ('site', 0),
+            ('difficulty', 0),
+            ('nb', 0),
+        ),
+    })
+
     def __init__(self):
         self._data : Dict[str, Dict[str, Any]] = {
-            'package': {
-                'day': '',
-                'url': '',
-                'title': '',
-                'title_index': '',
-                'site': '',
-                'difficulty': '',
-                'problem': '',
-                'submitted_solution': '',
-                'site_solution': '',
-                'solution': '',
-                'notes': '',
-                'nb': '',
-                'nb_index': '',
-                'seq_full': '',
-                'filename': '',
-                'lastline': '\n',
-            },
-
-            'package_widths': {
-                'day': 0,
-                'title': 0,
-                'solution': 0,
-                'site': 0,
-                'difficulty': 0,
-                'nb': 0,
-            },
-
-        }
-
-        # Store initial state for reset functionality
-        self._initial_state : Dict[str, Dict[str, Any]]  = {
-            'package': {
-                'day': '',
-                'url': '',
-                'title': '',
-                'title_index': '',
-                'site': '',
-                'site_index': '',
-                'difficulty': '',
-                'problem': '',
-                'submitted_solution': '',
-                'site_solution': '',
-                'notes': '',
-                'nb': '',
-                'seq_full': '',
-                'filename': '',
-                'lastline': '\n',
-            },
-
-            'package_col_widths': {
-                'day': 0,
-                'title': 0,
-                'solution': 0,
-                'site': 0,
-                'difficulty': 0,
-                'nb': 0,
-            },
+            dict_name: dict(defaults) for dict_name, defaults in self._DEFAULTS.items()
         }
 
 
@@ -166,6 +149,28 @@ class PackageManager:
             raise KeyError(f'Invalid dictionary name \'{dict_name}\' or key \'{key}\'')
 
 
+    def update_values(self, dict_name: str, values: Dict[str, Any]) -> None:
+        """
+        Update several values in a specified dictionary in one call.
+
+        Args:
+            dict_name (str): Name of the dictionary to update
+            values (Dict[str, Any]): Keys and new values to set
+
+        Raises:
+            KeyError: If dictionary name or any key is invalid
+        """
+        if dict_name not in self._data:
+            raise KeyError(f'Invalid dictionary name \'{dict_name}\'')
+
+        target = self._data[dict_name]
+        invalid_keys = values.keys() - target.keys()
+        if invalid_keys:
+            raise KeyError(f'Invalid keys {sorted(invalid_keys)} for dictionary \'{dict_name}\'')
+
+        target.update(values)
+
+
     def get_dictionary(self, dict_name: str) -> Dict[str, Any]:
         """
         Retrieve an entire dictionary by its name.
@@ -184,6 +189,26 @@ class PackageManager:
         raise KeyError(f'Invalid dictionary name \'{dict_name}\'')
 
 
+    def set_dictionary(self, dict_name: str, values: Dict[str, Any]) -> None:
+        """
+        Replace an entire dictionary by its name.
+
+        Args:
+            dict_name (str): Name of the dictionary to replace
+            values (Dict[str, Any]): New dictionary with exactly the expected keys
+
+        Raises:
+            KeyError: If dictionary name is invalid or keys do not match
+        """
+        if dict_name not in self._data:
+            raise KeyError(f'Invalid dictionary name \'{dict_name}\'')
+
+        if values.keys() != self._data[dict_name].keys():
+            raise KeyError(f'Invalid keys {sorted(values.keys())} for dictionary \'{dict_name}\'')
+
+        self._data[dict_name] = values
+
+
     def reset(self, dict_names: Optional[List[str]] = None) -> None:
         """
         Reset specified dictionaries or all dictionaries to their initial state.
@@ -196,10 +221,10 @@ class PackageManager:
             KeyError: If any dictionary name in the list is invalid
         """
         if dict_names is None:
-            self._data = self._initial_state.copy()
-        else:
-            for dict_name in dict_names:
-                if dict_name in self._initial_state:
-                    self._data[dict_name] = self._initial_state[dict_name].copy()
-                else:
-                    raise KeyError(f'Invalid dictionary name \'{dict_name}\'')
+            dict_names = list(self._DEFAULTS)
+
+        for dict_name in dict_names:
+            if dict_name in self._DEFAULTS:
+                self._data[dict_name] = dict(self._DEFAULTS[dict_name])
+            else:
+                raise KeyError(f'Invalid dictionary name \'{dict_name}\'')
@@ -3,14 +3,17 @@ Utility Functions for Project Runs
 """
 
 # Python Standard Library
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Tuple
 
 # Third-Party Libraries
-from jinja2 import Template
+from jinja2 import Environment
+from jinja2 import FileSystemLoader
 
 # Local
 from src.config import ConfigManager
-from src.utils import PackageManager
+from src.utils import INDEX_START
+from src.utils import INDEX_END
 
 
 
@@ -21,6 +24,11 @@ from src.utils import PackageManager
 
 
 
+# Index table columns, in display order
+_INDEX_KEYS = ('day', 'title', 'solution', 'site', 'difficulty', 'nb')
+_INDEX_KEYS_NO_NB = _INDEX_KEYS[:-1]  # Exclude 'nb'
+
+
 def clean_strings(data: Dict[str, str]) -> Dict[str, str]:
     """
     Remove newline characters from string values in a dictionary.
@@ -35,13 +43,34 @@ def clean_strings(data: Dict[str, str]) -> Dict[str, str]:
     Dict[str, str]
         Cleaned dictionary with newlines removed from string values
     """
-    cleaned_dict = {}
-    for key, value in data.items():
-        if isinstance(value, str):
-            cleaned_dict[key] = value.strip('\n')
-        else:
-            cleaned_dict[key] = value
-    return cleaned_dict
+    return {
+        key: value.strip('\n') if isinstance(value, str) else value
+        for key, value in data.items()
+    }
+
+
+@lru_cache(maxsize=None)
+def _get_files_env(templates_dir: str) -> Environment:
+    """
+    Return the Jinja2 environment for a templates directory.
+
+    Parameters
+    ----------
+    templates_dir : str
+        Directory containing the solution template
+
+    Returns
+    -------
+    Environment
+        Environment created on first use and shared by later calls
+
+    Notes
+    -----
+    The environment keeps compiled templates in its cache, so solution.txt
+    is parsed once. auto_reload stays on, so changes made to the template
+    at project start are picked up on the next render.
+    """
+    return Environment(loader=FileSystemLoader(templates_dir))
 
 
 def get_files_created(config: ConfigManager, data: Dict[str, Any]) -> int:
@@ -60,21 +89,80 @@ def get_files_created(config: ConfigManager, data: Dict[str, Any]) -> int:
     int
         1 on successful file creation
     """
-    with open(f'{config.get('TEMPLATES_DIR')}/solution.txt', 'r', encoding='utf-8') as file:
-        template_content = file.read()
+    return get_files_created_many(config, [data])
 
-    # Create a Jinja2 template object
-    template = Template(template_content)
 
-    # Render the template with the data
-    filled_document = template.render(data)
+def get_files_created_many(config: ConfigManager, rows: Iterable[Dict[str, Any]]) -> int:
+    """
+    Create several solution files using a template and provided data.
 
-    with open(f'solutions/{data["filename"]}', 'w', encoding='utf-8') as file:
-        file.write(filled_document)
+    Parameters
+    ----------
+    config : ConfigManager
+        Custom container for validating, storing and retrieving application settings
+    rows : Iterable[Dict[str, Any]]
+        Dictionaries containing template variables including "filename"
+
+    Returns
+    -------
+    int
+        1 on successful file creation
+
+    Notes
+    -----
+    The template and solutions directory are looked up once for all rows.
+    """
+    # Compiled template is cached by the environment
+    template = _get_files_env(config.get('TEMPLATES_DIR')).get_template('solution.txt')
+    solutions_dir = config.get('SOLUTIONS_DIR')
+
+    for data in rows:
+
+        # Render the template with the data
+        filled_document = template.render(data)
+
+        with open(f'{solutions_dir}/{data["filename"]}', 'w', encoding='utf-8') as file:
+            file.write(filled_document)
 
     return 1
 
 
+def get_index_bounds(lines: List[str]) -> Tuple[int, int]:
+    """
+    Locate the Index block markers in the lines of README.md.
+
+    Parameters
+    ----------
+    lines : List[str]
+        Lines of README.md
+
+    Returns
+    -------
+    Tuple[int, int]
+        Line numbers of the start and end markers
+
+    Raises
+    ------
+    ValueError
+        If either marker is missing
+
+    Notes
+    -----
+    Scans forward once and stops at the first end marker found after the
+    start marker, so lines after the Index block are never visited.
+    """
+    start_line = None
+
+    for i, line in enumerate(lines):
+        if start_line is None:
+            if line.startswith(INDEX_START):
+                start_line = i
+        elif line.startswith(INDEX_END):
+            return start_line, i
+
+    raise ValueError('Invalid README.md: Index block markers not found')
+
+
 def get_target_line_dict(nb_loc: int, line: str) -> Dict[str, str]:
     """
     Parse a table line into a dictionary based on notebook configuration.
@@ -96,44 +184,32 @@ def get_target_line_dict(nb_loc: int, line: str) -> Dict[str, str]:
     ValueError
         If notebook configuration is invalid
     """
-    data = {
-        'day': '',
-        'title': '',
-        'solution': '',
-        'site': '',
-        'difficulty': '',
-        'nb': '',
-    }
+    data = dict.fromkeys(_INDEX_KEYS, '')
 
     if nb_loc == 0:
 
-        keys = list(data.keys())[:-1]  # Exclude 'nb'
+        keys = _INDEX_KEYS_NO_NB
 
     elif nb_loc == 1:
 
-        keys = list(data.keys())
+        keys = _INDEX_KEYS
 
     else:
 
         raise ValueError('Invalid configuration: TODO')
 
 
-    segments = []
-    for segment in line.split('|'):
-        segment = segment.strip()
-        if segment:
-            segments.append(segment)
+    segments = [segment for segment in map(str.strip, line.split('|')) if segment]
 
-    for i, key in enumerate(keys):
-        if i < len(segments):
-            data[key] = f'{segments[i]}'
+    # zip stops at the shorter sequence, so missing cells stay empty
+    data.update(zip(keys, segments))
 
     results = data
 
     return results
 
 
-def get_target_line_updated(is_second_line: bool, config: ConfigManager, package: PackageManager, data: Dict[str, str]) -> str:
+def get_target_line_updated(is_second_line: bool, nb_loc: int, widths: Dict[str, int], data: Dict[str, str]) -> str:
     """
     Format a table line with proper padding based on column widths.
 
@@ -141,10 +217,10 @@ def get_target_line_updated(is_second_line: bool, config: ConfigManager, package
     ----------
     is_second_line : bool
         Boolean indicating if this is the second line of Index table
-    config : ConfigManager
-        Custom container for validating, storing and retrieving application settings
-    package : PackageManager
-        Custom container for storing and retrieving form data and derived values
+    nb_loc : int
+        Notebook configuration value determining whether the sixth column is shown
+    widths : Dict[str, int]
+        Dictionary containing the width of each Index column
     data : Dict[str, str]
         Dictionary containing table cell values
 
@@ -157,58 +233,30 @@ def get_target_line_updated(is_second_line: bool, config: ConfigManager, package
     ------
     ValueError
         If notebook configuration is invalid
-    """
-    nb_local = config.get('NB')
-    widths = package.get_dictionary('package_widths')
-
-    if data is None:
-        data_dict = package.get_dictionary('package')
-        data = {
-            'day': data_dict['day'],
-            'title': data_dict['title'],
-            'solution': data_dict['solution'],
-            'site': data_dict['site'],       
-            'difficulty': data_dict['difficulty'],
-            'nb': data_dict['nb'],
-        }
-
-    target_line = '|'
-
-    if nb_local == 0:
-
-        for key, value in data.items():
-
-            if key != 'nb':  # Skip the "nb" key
 
-                value_str = str(value)
-                diff = widths[key] - len(value_str)
-
-                if is_second_line is True:
-                    padding = '-' * diff
-                else:
-                    padding = ' ' * diff
-
-                target_line += f' {value_str}{padding} |'
-
-    elif nb_local == 1:
+    Notes
+    -----
+    Settings are passed in by the caller, so re-formatting a whole Index
+    looks them up once rather than once per line.
+    """
+    # The separator line is padded with hyphens, every other line with spaces
+    pad_char = '-' if is_second_line is True else ' '
 
-        for key, value in data.items():
+    if nb_loc == 0:
 
-            value_str = str(value)
-            diff = widths[key] - len(value_str)
+        keys = _INDEX_KEYS_NO_NB
 
-            if is_second_line is True:
-                padding = '-' * diff
-            else:
-                padding = ' ' * diff
+    elif nb_loc == 1:
 
-            target_line += f' {value_str}{padding} |'
+        keys = _INDEX_KEYS
 
     else:
 
         raise ValueError('Invalid configuration: TODO')
 
-    results = target_line
+    cells = ' | '.join(str(data[key]).ljust(widths[key], pad_char) for key in keys)
+
+    results = f'| {cells} |'
 
 
     return results